@@ -5,9 +5,11 @@ Provides the PyQt6-based user interface for sending LSL markers.
 
 import sys
 import traceback
+from collections import deque
+from functools import cache
 from typing import Optional
 
-from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtCore import QSignalBlocker, QStringListModel, Qt, QTimer, pyqtSlot
 from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import (
     QApplication,
@@ -16,14 +18,19 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QMainWindow,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
-from mobi_marker.lsl_stream import LSLStreamThread, format_status_message
+from mobi_marker.lsl_stream import (
+    LSLStreamThread,
+    StatusEntry,
+    capture_status,
+    format_status_entry,
+)
 
 AVAILABLE_MODALITIES = [
     "EEG",
@@ -38,6 +45,60 @@ AVAILABLE_MODALITIES = [
     "Other",
 ]
 
+# Fixed END markers for the dropdown; only "Other" is built per click
+_END_MARKERS = {
+    modality: sys.intern(f"END {modality}")
+    for modality in AVAILABLE_MODALITIES
+    if modality != "Other"
+}
+
+
+@cache
+def _modality_model() -> QStringListModel:
+    """Return the modality list model shared by all modality dropdowns.
+
+    Built lazily so no Qt object is created at import time.
+    """
+    return QStringListModel(AVAILABLE_MODALITIES)
+
+
+QUICK_MARKERS = [
+    ("START", "#27ae60"),  # Green
+    ("END", "#e74c3c"),  # Red
+    ("PAUSE", "#f39c12"),  # Orange
+    ("RESUME", "#2ecc71"),  # Light green
+    ("ERROR", "#c0392b"),  # Dark red
+    ("NOTE", "#3498db"),  # Blue
+    ("START BREAK", "#8e44ad"),  # Purple
+    ("END BREAK", "#e67e22"),  # Dark orange
+]
+
+_QUICK_BUTTON_QSS_TEMPLATE = (
+    "QPushButton {{"
+    "    background-color: {color};"
+    "    color: white;"
+    "    font-weight: bold;"
+    "    padding: 8px 16px;"
+    "    border: none;"
+    "    border-radius: 4px;"
+    "    min-height: 30px;"
+    "}}"
+    "QPushButton:hover {{"
+    "    background-color: {color}CC;"  # Add transparency on hover
+    "}}"
+    "QPushButton:pressed {{"
+    "    background-color: {color}99;"  # More transparency when pressed
+    "}}"
+)
+
+# Built once at import so each button reuses its color's stylesheet string
+_QUICK_BUTTON_QSS = {
+    color: _QUICK_BUTTON_QSS_TEMPLATE.format(color=color) for _, color in QUICK_MARKERS
+}
+
+STATUS_FLUSH_INTERVAL_MS = 75
+STATUS_LOG_MAX_LINES = 1000
+
 
 class MobiMarkerGUI(QMainWindow):
     """Main GUI window for the LSL marker application.
@@ -49,8 +110,9 @@ class MobiMarkerGUI(QMainWindow):
     Attributes:
         lsl_thread: The LSL stream thread for handling marker transmission.
         marker_input: Text input field for entering custom marker text.
-        status_display: Text area for displaying status messages with both
-            human-readable and LSL timestamps.
+        status_display: List view for displaying status messages with both
+            human-readable and LSL timestamps, keeping the last
+            STATUS_LOG_MAX_LINES messages.
         send_button: Button for sending custom markers from the input field.
         end_modality_button: Button for sending END [modality] markers.
         modality_combo: Dropdown for selecting recording modality.
@@ -60,12 +122,17 @@ class MobiMarkerGUI(QMainWindow):
     def __init__(self) -> None:
         """Initialize the main window.
 
-        Sets up the GUI components and starts the LSL stream.
+        Sets up the GUI components and schedules the LSL stream to start once
+        the event loop is running, so the window paints before the outlet is
+        created.
         """
         super().__init__()
         self.lsl_thread: Optional[LSLStreamThread] = None
+        self._pending_status: deque[str | StatusEntry] = deque(
+            maxlen=STATUS_LOG_MAX_LINES
+        )
         self.init_ui()
-        self.start_lsl_stream()
+        QTimer.singleShot(0, self.start_lsl_stream)
 
     def init_ui(self) -> None:
         """Initialize the user interface.
@@ -120,45 +187,16 @@ class MobiMarkerGUI(QMainWindow):
 
         quick_buttons_layout = QGridLayout()
 
-        # Define quick marker buttons
-        quick_markers = [
-            ("START", "#27ae60"),  # Green
-            ("END", "#e74c3c"),  # Red
-            ("PAUSE", "#f39c12"),  # Orange
-            ("RESUME", "#2ecc71"),  # Light green
-            ("ERROR", "#c0392b"),  # Dark red
-            ("NOTE", "#3498db"),  # Blue
-            ("START BREAK", "#8e44ad"),  # Purple
-            ("END BREAK", "#e67e22"),  # Dark orange
-        ]
-
         # Create and add quick marker buttons
         self.quick_marker_buttons: list[QPushButton] = []
         row = 0
         col = 0
-        for marker_text, color in quick_markers:
+        for marker_text, color in QUICK_MARKERS:
             button = QPushButton(marker_text)
             button.setEnabled(False)  # Disabled until stream is ready
-            button.setStyleSheet(
-                f"QPushButton {{"
-                f"    background-color: {color};"
-                f"    color: white;"
-                f"    font-weight: bold;"
-                f"    padding: 8px 16px;"
-                f"    border: none;"
-                f"    border-radius: 4px;"
-                f"    min-height: 30px;"
-                f"}}"
-                f"QPushButton:hover {{"
-                f"    background-color: {color}CC;"  # Add transparency on hover
-                f"}}"
-                f"QPushButton:pressed {{"
-                f"    background-color: {color}99;"  # More transparency when pressed
-                f"}}"
-            )
-            button.clicked.connect(
-                lambda checked, text=marker_text: self.send_quick_marker(text)
-            )
+            button.setStyleSheet(_QUICK_BUTTON_QSS[color])
+            button.setObjectName(f"quick_{marker_text}")
+            button.clicked.connect(self._on_quick_clicked)
             quick_buttons_layout.addWidget(button, row, col)
             self.quick_marker_buttons.append(button)
 
@@ -215,7 +253,7 @@ class MobiMarkerGUI(QMainWindow):
 
         # Modality dropdown
         self.modality_combo = QComboBox()
-        self.modality_combo.addItems(AVAILABLE_MODALITIES)
+        self.modality_combo.setModel(_modality_model())
         self.modality_combo.setStyleSheet(
             "QComboBox {"
             "    padding: 8px 12px;"
@@ -269,11 +307,20 @@ class MobiMarkerGUI(QMainWindow):
         status_label.setStyleSheet("font-weight: bold; margin-top: 20px;")
         layout.addWidget(status_label)
 
-        self.status_display = QTextEdit()
-        self.status_display.setReadOnly(True)
+        self._status_model = QStringListModel()
+        self.status_display = QListView()
+        self.status_display.setModel(self._status_model)
+        self.status_display.setUniformItemSizes(True)
+        self.status_display.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self.status_display.setMaximumHeight(200)
         layout.addWidget(self.status_display)
 
+        # Flush queued status messages in batches on the GUI thread
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(STATUS_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_status)
+        self._flush_timer.start()
+
         # Focus on the input field
         self.marker_input.setFocus()
 
@@ -304,7 +351,7 @@ class MobiMarkerGUI(QMainWindow):
 
         if not ready:
             self.update_status(
-                format_status_message(
+                capture_status(
                     "Warning: LSL stream failed to start. Marker buttons disabled."
                 )
             )
@@ -319,16 +366,14 @@ class MobiMarkerGUI(QMainWindow):
         marker_text = self.marker_input.text().strip()
 
         if not marker_text:
-            self.update_status(format_status_message("Error: Empty marker text"))
+            self.update_status(capture_status("Error: Empty marker text"))
             return
 
         if self.lsl_thread is not None:
             self.lsl_thread.send_marker(marker_text)
             self.marker_input.clear()
         else:
-            self.update_status(
-                format_status_message("Error: LSL stream not initialized")
-            )
+            self.update_status(capture_status("Error: LSL stream not initialized"))
 
     def send_quick_marker(self, marker_text: str) -> None:
         """Send a predefined quick marker.
@@ -343,9 +388,14 @@ class MobiMarkerGUI(QMainWindow):
         if self.lsl_thread is not None:
             self.lsl_thread.send_marker(marker_text)
         else:
-            self.update_status(
-                format_status_message("Error: LSL stream not initialized")
-            )
+            self.update_status(capture_status("Error: LSL stream not initialized"))
+
+    @pyqtSlot()
+    def _on_quick_clicked(self) -> None:
+        """Send the quick marker of whichever button was clicked."""
+        button = self.sender()
+        if isinstance(button, QPushButton):
+            self.send_quick_marker(button.text())
 
     def on_modality_changed(self, modality: str) -> None:
         """Handle modality dropdown selection change.
@@ -378,35 +428,75 @@ class MobiMarkerGUI(QMainWindow):
             custom_modality = self.custom_modality_input.text().strip()
             if not custom_modality:
                 self.update_status(
-                    format_status_message("Error: Please enter a custom modality")
+                    capture_status("Error: Please enter a custom modality")
                 )
                 return
             marker_text = f"END {custom_modality.upper()}"
             self.custom_modality_input.clear()
         else:
-            marker_text = f"END {modality}"
+            marker_text = _END_MARKERS[modality]
 
         if self.lsl_thread is not None:
             self.lsl_thread.send_marker(marker_text)
         else:
-            self.update_status(
-                format_status_message("Error: LSL stream not initialized")
-            )
+            self.update_status(capture_status("Error: LSL stream not initialized"))
 
-    def update_status(self, message: str) -> None:
-        """Update the status display with a new message.
+    def update_status(self, message: str | StatusEntry) -> None:
+        """Queue a new message for the status display.
 
         Args:
-            message: The status message to display in the status log.
+            message: The formatted status message to display in the status log,
+                or a `StatusEntry` from `capture_status` to be formatted when
+                it is displayed.
 
         Note:
-            The status display automatically scrolls to show the newest message.
+            Messages are written to the status display in batches by
+            `_flush_status`, so a burst of markers costs a single relayout.
+            Messages pushed out of the bounded queue before a flush are
+            never formatted.
         """
-        self.status_display.append(message)
-        # Auto-scroll to bottom
-        scrollbar = self.status_display.verticalScrollBar()
-        if scrollbar is not None:
-            scrollbar.setValue(scrollbar.maximum())
+        self._pending_status.append(message)
+
+    def _flush_status(self) -> None:
+        """Write all queued status messages to the status display.
+
+        Note:
+            The status display scrolls to show the newest message on the next
+            event loop pass, after the view has laid out the new rows.
+        """
+        if not self._pending_status:
+            return
+
+        lines = [
+            entry if isinstance(entry, str) else format_status_entry(entry)
+            for entry in self._pending_status
+        ]
+        self._pending_status.clear()
+
+        model = self._status_model
+        view = self.status_display
+        # Coalesce the row changes below into a single repaint
+        view.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(view.verticalScrollBar()):
+                row = model.rowCount()
+                model.insertRows(row, len(lines))
+                for offset, line in enumerate(lines):
+                    model.setData(model.index(row + offset), line)
+
+                # Drop the oldest messages to keep the log bounded
+                excess = model.rowCount() - STATUS_LOG_MAX_LINES
+                if excess > 0:
+                    model.removeRows(0, excess)
+        finally:
+            view.setUpdatesEnabled(True)
+
+        # Scroll once the view has laid out the new rows
+        QTimer.singleShot(0, self._scroll_to_bottom)
+
+    def _scroll_to_bottom(self) -> None:
+        """Scroll the status display to show the newest message."""
+        self.status_display.scrollToBottom()
 
     def closeEvent(self, event: QCloseEvent | None) -> None:
         """Handle window close event.
@@ -417,10 +507,10 @@ class MobiMarkerGUI(QMainWindow):
             event: The close event from Qt.
         """
         if self.lsl_thread is not None:
-            self.lsl_thread.quit()
+            self.lsl_thread.stop()
             if not self.lsl_thread.wait(3000):
                 self.update_status(
-                    format_status_message("Warning: LSL thread did not stop gracefully")
+                    capture_status("Warning: LSL thread did not stop gracefully")
                 )
                 self.lsl_thread.terminate()
                 self.lsl_thread.wait()
@@ -3,44 +3,114 @@
 Provides thread-safe LSL stream handling for sending markers.
 """
 
-from datetime import datetime
+import queue
+import threading
+import time
+from concurrent.futures import Future, wait
+from functools import lru_cache
 from typing import Optional
 
 from pylsl import StreamInfo, StreamOutlet, local_clock
-from PyQt6.QtCore import QMutex, QMutexLocker, QThread, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QThread, pyqtSignal
+
+OUTLET_POLL_TIMEOUT_S = 0.05
+
+# Wall-clock time in epoch nanoseconds, LSL clock time, and text of a not yet
+# formatted status message
+StatusEntry = tuple[int, float, str]
+
+# Pre-bound %-formatting skips the per-field __format__ dispatch of an f-string;
+# the milliseconds are filled in here so no intermediate human-time string is built
+_format_status = "[%s.%03d | LSL: %.3f] %s".__mod__
+
+
+@lru_cache(maxsize=1)
+def _format_second(second: int) -> str:
+    """Format a whole epoch second as local date and time."""
+    lt = time.localtime(second)
+    return (
+        f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} "
+        f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+    )
+
+
+def _split_wall_time(now_ns: int) -> tuple[str, int]:
+    """Split an epoch time in nanoseconds into its local second and milliseconds.
+
+    Integer division truncates exactly like `strftime("%f")`; splitting a float
+    time can land one millisecond low on whole-millisecond values.
+    """
+    second, ns = divmod(now_ns, 1_000_000_000)
+    return _format_second(second), ns // 1_000_000
 
 
 def format_timestamp() -> tuple[str, float]:
     """Get formatted human time and LSL clock time."""
-    human_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    human_time = "%s.%03d" % _split_wall_time(time.time_ns())
     lsl_time = local_clock()
     return human_time, lsl_time
 
 
+def capture_status(message: str) -> StatusEntry:
+    """Capture the timestamps of a status message without formatting it."""
+    return time.time_ns(), local_clock(), message
+
+
+def format_status_entry(entry: StatusEntry) -> str:
+    """Format a captured status message with its timestamps."""
+    wall_time, lsl_time, message = entry
+    return _format_status((*_split_wall_time(wall_time), lsl_time, message))
+
+
 def format_status_message(message: str) -> str:
     """Format a status message with timestamps."""
-    human_time, lsl_time = format_timestamp()
-    return f"[{human_time} | LSL: {lsl_time:.3f}] {message}"
+    return format_status_entry(capture_status(message))
+
+
+def _create_outlet_in_background(stream_info: StreamInfo) -> Future[StreamOutlet]:
+    """Start creating an outlet for `stream_info` on a daemon thread.
+
+    Returns:
+        A future resolved with the outlet, or with the error creating it.
+
+    Note:
+        The thread is a daemon so an outlet creation that hangs in liblsl
+        never keeps the process from exiting. `ThreadPoolExecutor` workers
+        are joined at interpreter exit, which is why one is not used here.
+    """
+    future: Future[StreamOutlet] = Future()
+
+    def create() -> None:
+        try:
+            future.set_result(StreamOutlet(stream_info))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=create, name="lsl-outlet-create", daemon=True).start()
+    return future
 
 
 class LSLStreamThread(QThread):
     """Thread for managing the LSL stream outlet.
 
     Handles creation and management of an LSL stream in a separate thread
-    to keep the GUI responsive.
+    to keep the GUI responsive. The outlet is owned by the worker thread:
+    it is assigned once in `run()` before `_is_ready` is set and is only
+    used by the worker loop, which drains markers put on `_queue` by the
+    GUI thread.
     """
 
     status_update = pyqtSignal(str)
     stream_ready = pyqtSignal(bool)
-    marker_request = pyqtSignal(str)
 
     def __init__(self) -> None:
         """Initialize the LSL stream thread."""
         super().__init__()
         self.outlet: Optional[StreamOutlet] = None
         self.stream_info: Optional[StreamInfo] = None
-        self._mutex = QMutex()
         self._is_ready = False
+        # None is the sentinel that wakes the worker loop to stop
+        self._queue: queue.SimpleQueue[Optional[str]] = queue.SimpleQueue()
 
     def run(self) -> None:
         """Create and maintain the LSL stream."""
@@ -53,42 +123,53 @@ class LSLStreamThread(QThread):
                 channel_format="string",
                 source_id="mobi_marker_gui_v1",
             )
-            outlet = StreamOutlet(stream_info)
+            # Create the outlet off this thread so a stop request is seen promptly
+            future = _create_outlet_in_background(stream_info)
+            while not wait([future], timeout=OUTLET_POLL_TIMEOUT_S).done:
+                if self.isInterruptionRequested():
+                    return
+            outlet = future.result()
 
-            with QMutexLocker(self._mutex):
-                self.stream_info = stream_info
-                self.outlet = outlet
-                self._is_ready = True
+            self.stream_info = stream_info
+            self.outlet = outlet
+            self._is_ready = True
 
             self.status_update.emit(
                 format_status_message("LSL stream started successfully")
             )
             self.stream_ready.emit(True)
 
-            self.marker_request.connect(self._handle_marker_request)
-            self.exec()
-
         except Exception as e:
             self.status_update.emit(
                 format_status_message(f"Error starting LSL stream: {e}")
             )
             self.stream_ready.emit(False)
+            return
+
+        # The stop sentinel queues behind pending markers, so all are sent first
+        while (marker := self._queue.get()) is not None:
+            self._handle_marker_request(marker)
 
     def send_marker(self, marker: str) -> None:
         """Request to send a marker (thread-safe, callable from GUI thread)."""
-        with QMutexLocker(self._mutex):
-            if not self._is_ready:
-                self.status_update.emit(format_status_message("LSL stream not active"))
-                return
+        if not self._is_ready:
+            self.status_update.emit(format_status_message("LSL stream not active"))
+            return
 
-        self.marker_request.emit(marker)
+        self._queue.put_nowait(marker)
+
+    def stop(self) -> None:
+        """Request the worker loop to exit (thread-safe, callable from GUI thread).
+
+        Markers already queued are still sent; the interruption request only
+        cuts short an outlet that is still being created.
+        """
+        self.requestInterruption()
+        self._queue.put_nowait(None)
 
-    @pyqtSlot(str)
     def _handle_marker_request(self, marker: str) -> None:
         """Handle marker request in the worker thread."""
-        with QMutexLocker(self._mutex):
-            outlet = self.outlet
-
+        outlet = self.outlet
         if outlet is None:
             self.status_update.emit(format_status_message("LSL stream not active"))
             return
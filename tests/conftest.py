@@ -0,0 +1,64 @@
+"""Shared test configuration.
+
+Installs lightweight stand-ins for ``PyQt6.QtWidgets`` and ``PyQt6.QtGui``
+before ``mobi_marker`` is first imported, so test workers never load the
+native widget libraries. ``PyQt6.QtCore`` stays real: the LSL thread, signals,
+timers, and the status model are exercised against it, under one
+``QCoreApplication`` shared by the whole session.
+"""
+
+import sys
+from types import ModuleType
+from unittest.mock import Mock
+
+import pytest
+from PyQt6.QtCore import QCoreApplication, QObject
+
+
+class _Widget(QObject):
+    """Stand-in base for the widget classes the GUI imports."""
+
+
+class _PushButton(_Widget):
+    """Stand-in for QPushButton exposing the API the GUI reads."""
+
+    def text(self) -> str:
+        """Return the button label."""
+        return ""
+
+
+def _stub_module(name: str, **attrs: object) -> None:
+    """Register a stub module under `name` unless the real one is loaded."""
+    if name in sys.modules:
+        return
+    module = ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+
+
+_stub_module(
+    "PyQt6.QtWidgets",
+    QApplication=Mock(),
+    **{
+        name: type(name, (_Widget,), {})
+        for name in (
+            "QComboBox",
+            "QGridLayout",
+            "QHBoxLayout",
+            "QLabel",
+            "QLineEdit",
+            "QListView",
+            "QMainWindow",
+            "QVBoxLayout",
+            "QWidget",
+        )
+    },
+    QPushButton=_PushButton,
+)
+_stub_module("PyQt6.QtGui", QCloseEvent=type("QCloseEvent", (), {}))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp() -> QCoreApplication:
+    """Create the Qt core application once for every test in the session."""
+    return QCoreApplication.instance() or QCoreApplication(sys.argv)
@@ -1,71 +1,146 @@
 """Tests for the GUI module."""
 
-from unittest.mock import Mock, patch
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, call, patch
 
 import pytest
-
-from mobi_marker.gui import AVAILABLE_MODALITIES, MobiMarkerGUI, main
-
-
-@pytest.fixture
-def mock_gui() -> MobiMarkerGUI:
-    """Create a mocked GUI instance."""
+from PyQt6.QtCore import QObject, QStringListModel
+from PyQt6.QtWidgets import QPushButton
+
+import mobi_marker.gui as gui_mod
+from mobi_marker.gui import (
+    _QUICK_BUTTON_QSS,
+    AVAILABLE_MODALITIES,
+    QUICK_MARKERS,
+    STATUS_LOG_MAX_LINES,
+    MobiMarkerGUI,
+    _modality_model,
+    main,
+)
+
+# wait() results for a thread that times out once, then stops after terminate()
+_WAIT_SEQ = (False, True)
+
+
+class FakeLSLThread:
+    """Hand-written stand-in for LSLStreamThread with only the calls the GUI makes."""
+
+    def __init__(self) -> None:
+        """Create the recorded thread methods."""
+        # Plain Mock: nothing here uses magic methods, so skip MagicMock's setup
+        self.send_marker = Mock()
+        self.stop = Mock()
+        self.wait = Mock(return_value=True)
+        self.terminate = Mock()
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_qt() -> Iterator[None]:
+    """Keep real Qt windows, widgets, and timers out of the tests in this module.
+
+    Patching QTimer also keeps the deferred start_lsl_stream call from running.
+    """
     with (
-        patch("mobi_marker.gui.QApplication"),
-        patch("mobi_marker.gui.QMainWindow.__init__"),
-        patch("mobi_marker.gui.MobiMarkerGUI.init_ui"),
-        patch("mobi_marker.gui.MobiMarkerGUI.start_lsl_stream"),
+        patch.multiple(gui_mod, QApplication=DEFAULT, QTimer=DEFAULT),
+        patch.object(gui_mod.QMainWindow, "__init__"),
+        patch.object(MobiMarkerGUI, "init_ui"),
     ):
-        gui = MobiMarkerGUI()
-        gui.lsl_thread = Mock()
-        gui.marker_input = Mock()
-        gui.status_display = Mock()
-        gui.modality_combo = Mock()
-        gui.custom_modality_input = Mock()
-        gui.send_button = Mock()
-        gui.end_modality_button = Mock()
-        gui.quick_marker_buttons = [Mock(), Mock(), Mock()]
-        return gui
-
-
-def _lsl_thread(gui: MobiMarkerGUI) -> Mock:
-    """Return lsl_thread as Mock for mock assertions."""
-    return gui.lsl_thread  # type: ignore[return-value]
-
-
-def _marker_input(gui: MobiMarkerGUI) -> Mock:
-    """Return marker_input as Mock for mock assertions."""
-    return gui.marker_input  # type: ignore[return-value]
-
-
-def _status_display(gui: MobiMarkerGUI) -> Mock:
-    """Return status_display as Mock for mock assertions."""
-    return gui.status_display  # type: ignore[return-value]
+        yield
 
 
-def _modality_combo(gui: MobiMarkerGUI) -> Mock:
-    """Return modality_combo as Mock for mock assertions."""
-    return gui.modality_combo  # type: ignore[return-value]
+@pytest.fixture(autouse=True, scope="module")
+def mock_capture_status() -> Iterator[Mock]:
+    """Patch capture_status once so status tests never read the clocks."""
+    with patch.object(
+        gui_mod, "capture_status", return_value=(0, 0.0, "status")
+    ) as mock:
+        yield mock
 
 
-def _custom_modality_input(gui: MobiMarkerGUI) -> Mock:
-    """Return custom_modality_input as Mock for mock assertions."""
-    return gui.custom_modality_input  # type: ignore[return-value]
+@pytest.fixture(scope="module")
+def freshly_inited_gui(_patch_qt: None) -> SimpleNamespace:
+    """Construct one real-path GUI and run its deferred stream start.
 
-
-def _send_button(gui: MobiMarkerGUI) -> Mock:
-    """Return send_button as Mock for mock assertions."""
-    return gui.send_button  # type: ignore[return-value]
-
-
-def _end_modality_button(gui: MobiMarkerGUI) -> Mock:
-    """Return end_modality_button as Mock for mock assertions."""
-    return gui.end_modality_button  # type: ignore[return-value]
-
-
-def _quick_marker_buttons(gui: MobiMarkerGUI) -> list[Mock]:
-    """Return quick_marker_buttons as list[Mock] for mock assertions."""
-    return gui.quick_marker_buttons  # type: ignore[return-value]
+    Records the LSL thread as it was right after __init__, the QTimer used to
+    defer start_lsl_stream, and the patched LSLStreamThread class.
+    """
+    with (
+        patch.object(gui_mod, "QTimer") as mock_timer,
+        patch.object(gui_mod, "LSLStreamThread") as mock_thread_class,
+    ):
+        gui = MobiMarkerGUI()
+        thread_at_init = gui.lsl_thread
+        gui.start_lsl_stream()
+    return SimpleNamespace(
+        gui=gui,
+        thread_at_init=thread_at_init,
+        timer=mock_timer,
+        thread_class=mock_thread_class,
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_event() -> Mock:
+    """Close event shared by the closeEvent tests."""
+    return Mock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_event(mock_event: Mock) -> Iterator[None]:
+    """Clear recorded calls on the shared close event after each test."""
+    yield
+    mock_event.reset_mock()
+
+
+def _line_edit() -> SimpleNamespace:
+    """Stand-in for a QLineEdit holding empty text."""
+    return SimpleNamespace(
+        text=Mock(return_value=SimpleNamespace(strip=Mock(return_value=""))),
+        clear=Mock(),
+        setVisible=Mock(),
+        setFocus=Mock(),
+    )
+
+
+def _button() -> SimpleNamespace:
+    """Stand-in for a QPushButton."""
+    return SimpleNamespace(setEnabled=Mock())
+
+
+@pytest.fixture(scope="module")
+def mock_gui(_patch_qt: None) -> MobiMarkerGUI:
+    """Create a mocked GUI instance shared by the tests in this module."""
+    gui = MobiMarkerGUI()
+    gui._status_model = QStringListModel()
+    return gui
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_gui(mock_gui: MobiMarkerGUI, mock_capture_status: Mock) -> None:
+    """Give the shared GUI fresh widget stand-ins before each test.
+
+    Widgets are SimpleNamespaces with a Mock only for each method the GUI
+    calls, so no child mocks are auto-created on attribute access.
+    """
+    mock_capture_status.reset_mock()
+    # Some tests set lsl_thread to None, so give every test a fresh one
+    mock_gui.lsl_thread = FakeLSLThread()  # type: ignore[assignment]
+    mock_gui.marker_input = _line_edit()  # type: ignore[assignment]
+    mock_gui.status_display = SimpleNamespace(  # type: ignore[assignment]
+        verticalScrollBar=Mock(return_value=None),
+        setUpdatesEnabled=Mock(),
+        scrollToBottom=Mock(),
+    )
+    mock_gui.modality_combo = SimpleNamespace(  # type: ignore[assignment]
+        currentText=Mock(return_value="EEG")
+    )
+    mock_gui.custom_modality_input = _line_edit()  # type: ignore[assignment]
+    mock_gui.send_button = _button()  # type: ignore[assignment]
+    mock_gui.end_modality_button = _button()  # type: ignore[assignment]
+    mock_gui.quick_marker_buttons = [_button(), _button(), _button()]  # type: ignore[list-item]
+    mock_gui._pending_status.clear()
+    mock_gui._status_model.setStringList([])
 
 
 class TestAvailableModalities:
@@ -79,21 +154,43 @@ class TestAvailableModalities:
         """Other is the last item for custom input."""
         assert AVAILABLE_MODALITIES[-1] == "Other"
 
+    def test_model_lists_modalities(self) -> None:
+        """Shared modality model holds the modalities in order."""
+        assert _modality_model().stringList() == AVAILABLE_MODALITIES
+
+    def test_model_is_shared(self) -> None:
+        """The same model instance is returned on every call."""
+        assert _modality_model() is _modality_model()
+
+
+class TestQuickMarkers:
+    """Tests for QUICK_MARKERS and their prebuilt stylesheets."""
+
+    def test_every_color_has_stylesheet(self) -> None:
+        """Each quick marker color has a prebuilt stylesheet."""
+        for _, color in QUICK_MARKERS:
+            assert f"background-color: {color};" in _QUICK_BUTTON_QSS[color]
+
+    def test_stylesheet_has_hover_and_pressed_states(self) -> None:
+        """Stylesheets fade the button color on hover and press."""
+        qss = _QUICK_BUTTON_QSS["#27ae60"]
+
+        assert "#27ae60CC" in qss
+        assert "#27ae6099" in qss
+
 
 class TestMobiMarkerGUIInit:
     """Tests for MobiMarkerGUI initialization."""
 
-    def test_lsl_thread_starts_none(self) -> None:
+    def test_lsl_thread_starts_none(self, freshly_inited_gui: SimpleNamespace) -> None:
         """LSL thread is None before start_lsl_stream runs."""
-        with (
-            patch("mobi_marker.gui.QApplication"),
-            patch("mobi_marker.gui.QMainWindow.__init__"),
-            patch("mobi_marker.gui.MobiMarkerGUI.init_ui"),
-            patch("mobi_marker.gui.MobiMarkerGUI.start_lsl_stream"),
-        ):
-            gui = MobiMarkerGUI()
+        assert freshly_inited_gui.thread_at_init is None
 
-        assert gui.lsl_thread is None
+    def test_defers_stream_start(self, freshly_inited_gui: SimpleNamespace) -> None:
+        """Stream start is deferred until the event loop runs."""
+        freshly_inited_gui.timer.singleShot.assert_called_once_with(
+            0, freshly_inited_gui.gui.start_lsl_stream
+        )
 
 
 class TestSendMarker:
@@ -101,39 +198,31 @@ class TestSendMarker:
 
     def test_valid_input_sends_to_thread(self, mock_gui: MobiMarkerGUI) -> None:
         """Valid marker text is sent to the LSL thread."""
-        _marker_input(mock_gui).text.return_value.strip.return_value = "Test Marker"
+        mock_gui.marker_input.text.return_value.strip.return_value = "Test Marker"  # type: ignore[attr-defined]
 
         mock_gui.send_marker()
 
-        _lsl_thread(mock_gui).send_marker.assert_called_once_with("Test Marker")
+        mock_gui.lsl_thread.send_marker.assert_called_once_with("Test Marker")  # type: ignore[union-attr]
 
     def test_valid_input_clears_field(self, mock_gui: MobiMarkerGUI) -> None:
         """Input field is cleared after sending."""
-        _marker_input(mock_gui).text.return_value.strip.return_value = "Test"
+        mock_gui.marker_input.text.return_value.strip.return_value = "Test"  # type: ignore[attr-defined]
 
         mock_gui.send_marker()
 
-        _marker_input(mock_gui).clear.assert_called_once()
+        mock_gui.marker_input.clear.assert_called_once()  # type: ignore[attr-defined]
 
-    def test_empty_input_shows_error(self, mock_gui: MobiMarkerGUI) -> None:
+    def test_empty_input_shows_error(
+        self, mock_gui: MobiMarkerGUI, mock_capture_status: Mock
+    ) -> None:
         """Empty input shows error in status."""
-        _marker_input(mock_gui).text.return_value.strip.return_value = ""
-
-        with patch("mobi_marker.gui.format_status_message", return_value="error msg"):
-            mock_gui.send_marker()
-
-        _lsl_thread(mock_gui).send_marker.assert_not_called()
-        _status_display(mock_gui).append.assert_called()
-
-    def test_no_thread_shows_error(self, mock_gui: MobiMarkerGUI) -> None:
-        """No LSL thread shows error in status."""
-        mock_gui.lsl_thread = None
-        _marker_input(mock_gui).text.return_value.strip.return_value = "Test"
+        mock_gui.marker_input.text.return_value.strip.return_value = ""  # type: ignore[attr-defined]
 
-        with patch("mobi_marker.gui.format_status_message", return_value="error msg"):
-            mock_gui.send_marker()
+        mock_gui.send_marker()
 
-        _status_display(mock_gui).append.assert_called()
+        mock_gui.lsl_thread.send_marker.assert_not_called()  # type: ignore[union-attr]
+        mock_capture_status.assert_called_once_with("Error: Empty marker text")
+        assert mock_gui._pending_status
 
 
 class TestSendQuickMarker:
@@ -143,16 +232,28 @@ class TestSendQuickMarker:
         """Quick marker is sent to the LSL thread."""
         mock_gui.send_quick_marker("START")
 
-        _lsl_thread(mock_gui).send_marker.assert_called_once_with("START")
+        mock_gui.lsl_thread.send_marker.assert_called_once_with("START")  # type: ignore[union-attr]
 
-    def test_no_thread_shows_error(self, mock_gui: MobiMarkerGUI) -> None:
-        """No LSL thread shows error in status."""
-        mock_gui.lsl_thread = None
 
-        with patch("mobi_marker.gui.format_status_message", return_value="error"):
-            mock_gui.send_quick_marker("START")
+class TestOnQuickClicked:
+    """Tests for MobiMarkerGUI._on_quick_clicked() method."""
+
+    def test_sends_clicked_button_text(self, mock_gui: MobiMarkerGUI) -> None:
+        """Clicked quick button's text is sent as the marker."""
+        button = Mock(spec=QPushButton)
+        button.text.return_value = "PAUSE"
+
+        with patch.object(mock_gui, "sender", return_value=button):
+            mock_gui._on_quick_clicked()
 
-        _status_display(mock_gui).append.assert_called()
+        mock_gui.lsl_thread.send_marker.assert_called_once_with("PAUSE")  # type: ignore[union-attr]
+
+    def test_ignores_non_button_sender(self, mock_gui: MobiMarkerGUI) -> None:
+        """Nothing is sent when the slot is not invoked by a button."""
+        with patch.object(mock_gui, "sender", return_value=None):
+            mock_gui._on_quick_clicked()
+
+        mock_gui.lsl_thread.send_marker.assert_not_called()  # type: ignore[union-attr]
 
 
 class TestSendEndModalityMarker:
@@ -160,49 +261,76 @@ class TestSendEndModalityMarker:
 
     def test_standard_modality_sends_formatted(self, mock_gui: MobiMarkerGUI) -> None:
         """Standard modality sends 'END <modality>'."""
-        _modality_combo(mock_gui).currentText.return_value = "EEG"
+        mock_gui.modality_combo.currentText.return_value = "EEG"  # type: ignore[attr-defined]
 
         mock_gui.send_end_modality_marker()
 
-        _lsl_thread(mock_gui).send_marker.assert_called_once_with("END EEG")
+        mock_gui.lsl_thread.send_marker.assert_called_once_with("END EEG")  # type: ignore[union-attr]
+
+    def test_standard_modality_reuses_marker(self, mock_gui: MobiMarkerGUI) -> None:
+        """Standard modality sends the same precomputed marker string each time."""
+        mock_gui.modality_combo.currentText.return_value = "EEG"  # type: ignore[attr-defined]
+
+        mock_gui.send_end_modality_marker()
+        mock_gui.send_end_modality_marker()
+
+        first, second = mock_gui.lsl_thread.send_marker.call_args_list  # type: ignore[union-attr]
+        assert first.args[0] is second.args[0]
 
     def test_custom_modality_sends_uppercase(self, mock_gui: MobiMarkerGUI) -> None:
         """Custom modality is uppercased."""
-        _modality_combo(mock_gui).currentText.return_value = "Other"
-        _custom_modality_input(mock_gui).text.return_value.strip.return_value = "custom"
+        mock_gui.modality_combo.currentText.return_value = "Other"  # type: ignore[attr-defined]
+        mock_gui.custom_modality_input.text.return_value.strip.return_value = "custom"  # type: ignore[attr-defined]
 
         mock_gui.send_end_modality_marker()
 
-        _lsl_thread(mock_gui).send_marker.assert_called_once_with("END CUSTOM")
+        mock_gui.lsl_thread.send_marker.assert_called_once_with("END CUSTOM")  # type: ignore[union-attr]
 
     def test_custom_modality_clears_input(self, mock_gui: MobiMarkerGUI) -> None:
         """Custom input field is cleared after sending."""
-        _modality_combo(mock_gui).currentText.return_value = "Other"
-        _custom_modality_input(mock_gui).text.return_value.strip.return_value = "sensor"
+        mock_gui.modality_combo.currentText.return_value = "Other"  # type: ignore[attr-defined]
+        mock_gui.custom_modality_input.text.return_value.strip.return_value = "sensor"  # type: ignore[attr-defined]
 
         mock_gui.send_end_modality_marker()
 
-        _custom_modality_input(mock_gui).clear.assert_called_once()
+        mock_gui.custom_modality_input.clear.assert_called_once()  # type: ignore[attr-defined]
 
     def test_empty_custom_shows_error(self, mock_gui: MobiMarkerGUI) -> None:
         """Empty custom modality shows error."""
-        _modality_combo(mock_gui).currentText.return_value = "Other"
-        _custom_modality_input(mock_gui).text.return_value.strip.return_value = ""
-
-        with patch("mobi_marker.gui.format_status_message", return_value="error"):
-            mock_gui.send_end_modality_marker()
+        mock_gui.modality_combo.currentText.return_value = "Other"  # type: ignore[attr-defined]
+        mock_gui.custom_modality_input.text.return_value.strip.return_value = ""  # type: ignore[attr-defined]
 
-        _lsl_thread(mock_gui).send_marker.assert_not_called()
+        mock_gui.send_end_modality_marker()
 
-    def test_no_thread_shows_error(self, mock_gui: MobiMarkerGUI) -> None:
-        """No LSL thread shows error in status."""
+        mock_gui.lsl_thread.send_marker.assert_not_called()  # type: ignore[union-attr]
+
+
+class TestNoLslThread:
+    """Tests for sending markers before the LSL thread exists."""
+
+    @pytest.mark.parametrize(
+        "send",
+        [
+            MobiMarkerGUI.send_marker,
+            lambda gui: gui.send_quick_marker("START"),
+            MobiMarkerGUI.send_end_modality_marker,
+        ],
+        ids=["send_marker", "send_quick_marker", "send_end_modality_marker"],
+    )
+    def test_no_thread_shows_error(
+        self,
+        mock_gui: MobiMarkerGUI,
+        mock_capture_status: Mock,
+        send: Callable[[MobiMarkerGUI], None],
+    ) -> None:
+        """Each send path reports an uninitialized stream in the status log."""
         mock_gui.lsl_thread = None
-        _modality_combo(mock_gui).currentText.return_value = "EEG"
+        mock_gui.marker_input.text.return_value.strip.return_value = "Test"  # type: ignore[attr-defined]
 
-        with patch("mobi_marker.gui.format_status_message", return_value="error"):
-            mock_gui.send_end_modality_marker()
+        send(mock_gui)
 
-        _status_display(mock_gui).append.assert_called()
+        mock_capture_status.assert_called_once_with("Error: LSL stream not initialized")
+        assert mock_gui._pending_status
 
 
 class TestOnModalityChanged:
@@ -212,19 +340,19 @@ class TestOnModalityChanged:
         """Selecting 'Other' shows custom input field."""
         mock_gui.on_modality_changed("Other")
 
-        _custom_modality_input(mock_gui).setVisible.assert_called_once_with(True)
+        mock_gui.custom_modality_input.setVisible.assert_called_once_with(True)  # type: ignore[attr-defined]
 
     def test_other_focuses_custom_input(self, mock_gui: MobiMarkerGUI) -> None:
         """Selecting 'Other' focuses custom input field."""
         mock_gui.on_modality_changed("Other")
 
-        _custom_modality_input(mock_gui).setFocus.assert_called_once()
+        mock_gui.custom_modality_input.setFocus.assert_called_once()  # type: ignore[attr-defined]
 
     def test_standard_modality_hides_input(self, mock_gui: MobiMarkerGUI) -> None:
         """Selecting standard modality hides custom input."""
         mock_gui.on_modality_changed("EEG")
 
-        _custom_modality_input(mock_gui).setVisible.assert_called_once_with(False)
+        mock_gui.custom_modality_input.setVisible.assert_called_once_with(False)  # type: ignore[attr-defined]
 
 
 class TestOnStreamReady:
@@ -234,106 +362,189 @@ class TestOnStreamReady:
         """Stream ready enables send button."""
         mock_gui.on_stream_ready(True)
 
-        _send_button(mock_gui).setEnabled.assert_called_once_with(True)
+        mock_gui.send_button.setEnabled.assert_called_once_with(True)  # type: ignore[attr-defined]
 
     def test_ready_enables_modality_button(self, mock_gui: MobiMarkerGUI) -> None:
         """Stream ready enables end modality button."""
         mock_gui.on_stream_ready(True)
 
-        _end_modality_button(mock_gui).setEnabled.assert_called_once_with(True)
+        mock_gui.end_modality_button.setEnabled.assert_called_once_with(True)  # type: ignore[attr-defined]
 
     def test_ready_enables_quick_buttons(self, mock_gui: MobiMarkerGUI) -> None:
         """Stream ready enables all quick marker buttons."""
         mock_gui.on_stream_ready(True)
 
-        for button in _quick_marker_buttons(mock_gui):
-            button.setEnabled.assert_called_once_with(True)
+        for button in mock_gui.quick_marker_buttons:
+            button.setEnabled.assert_called_once_with(True)  # type: ignore[attr-defined]
 
     def test_not_ready_disables_buttons(self, mock_gui: MobiMarkerGUI) -> None:
         """Stream not ready disables buttons."""
-        with patch("mobi_marker.gui.format_status_message", return_value="warning"):
-            mock_gui.on_stream_ready(False)
+        mock_gui.on_stream_ready(False)
 
-        _send_button(mock_gui).setEnabled.assert_called_once_with(False)
+        mock_gui.send_button.setEnabled.assert_called_once_with(False)  # type: ignore[attr-defined]
 
     def test_not_ready_shows_warning(self, mock_gui: MobiMarkerGUI) -> None:
         """Stream not ready shows warning in status."""
-        with patch("mobi_marker.gui.format_status_message", return_value="warning"):
-            mock_gui.on_stream_ready(False)
+        mock_gui.on_stream_ready(False)
 
-        _status_display(mock_gui).append.assert_called()
+        assert mock_gui._pending_status
 
 
 class TestUpdateStatus:
     """Tests for MobiMarkerGUI.update_status() method."""
 
-    def test_appends_message(self, mock_gui: MobiMarkerGUI) -> None:
-        """Message is appended to status display."""
+    def test_queues_message(self, mock_gui: MobiMarkerGUI) -> None:
+        """Message is queued rather than written immediately."""
         mock_gui.update_status("Test message")
 
-        _status_display(mock_gui).append.assert_called_once_with("Test message")
+        assert list(mock_gui._pending_status) == ["Test message"]
+        assert mock_gui._status_model.rowCount() == 0
+
+
+class TestFlushStatus:
+    """Tests for MobiMarkerGUI._flush_status() method."""
+
+    def test_writes_batched_messages(self, mock_gui: MobiMarkerGUI) -> None:
+        """Queued messages are written to the status log."""
+        mock_gui.update_status("First")
+        mock_gui.update_status("Second")
+
+        mock_gui._flush_status()
+
+        assert mock_gui._status_model.stringList() == ["First", "Second"]
+        assert not mock_gui._pending_status
+
+    def test_formats_captured_entries(self, mock_gui: MobiMarkerGUI) -> None:
+        """Captured status entries are formatted when written."""
+        mock_gui.update_status((0, 12.5, "Captured"))
+
+        with patch.object(
+            gui_mod, "format_status_entry", return_value="formatted"
+        ) as mock_format:
+            mock_gui._flush_status()
+
+        mock_format.assert_called_once_with((0, 12.5, "Captured"))
+        assert mock_gui._status_model.stringList() == ["formatted"]
+
+    def test_overflowed_entries_are_not_formatted(
+        self, mock_gui: MobiMarkerGUI
+    ) -> None:
+        """Entries pushed out of the bounded queue are never formatted."""
+        for i in range(STATUS_LOG_MAX_LINES + 5):
+            mock_gui.update_status((0, float(i), "Captured"))
+
+        with patch.object(
+            gui_mod, "format_status_entry", return_value="formatted"
+        ) as mock_format:
+            mock_gui._flush_status()
+
+        assert mock_format.call_count == STATUS_LOG_MAX_LINES
+
+    def test_empty_queue_does_nothing(self, mock_gui: MobiMarkerGUI) -> None:
+        """Nothing is written when no messages are queued."""
+        mock_gui._flush_status()
+
+        assert mock_gui._status_model.rowCount() == 0
+        mock_gui.status_display.scrollToBottom.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_trims_oldest_messages(self, mock_gui: MobiMarkerGUI) -> None:
+        """Status log keeps only the newest STATUS_LOG_MAX_LINES messages."""
+        mock_gui._status_model.setStringList(["old"] * STATUS_LOG_MAX_LINES)
+        mock_gui.update_status("new")
+
+        mock_gui._flush_status()
+
+        lines = mock_gui._status_model.stringList()
+        assert len(lines) == STATUS_LOG_MAX_LINES
+        assert lines[-1] == "new"
 
-    def test_scrolls_to_bottom(self, mock_gui: MobiMarkerGUI) -> None:
+    def test_schedules_scroll_to_bottom(self, mock_gui: MobiMarkerGUI) -> None:
+        """Scrolling is deferred until after the view lays out the rows."""
+        mock_gui.update_status("Test")
+
+        with patch.object(gui_mod, "QTimer") as mock_timer:
+            mock_gui._flush_status()
+
+        mock_timer.singleShot.assert_called_once_with(0, mock_gui._scroll_to_bottom)
+        mock_gui.status_display.scrollToBottom.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_scroll_to_bottom(self, mock_gui: MobiMarkerGUI) -> None:
         """Status display scrolls to bottom."""
-        mock_scrollbar = Mock()
-        mock_scrollbar.maximum.return_value = 100
-        _status_display(mock_gui).verticalScrollBar.return_value = mock_scrollbar
+        mock_gui._scroll_to_bottom()
+
+        mock_gui.status_display.scrollToBottom.assert_called_once()  # type: ignore[attr-defined]
 
+    def test_suspends_updates_during_write(self, mock_gui: MobiMarkerGUI) -> None:
+        """Repaints are suspended while rows are written, then re-enabled."""
         mock_gui.update_status("Test")
 
-        mock_scrollbar.setValue.assert_called_once_with(100)
+        mock_gui._flush_status()
+
+        assert mock_gui.status_display.setUpdatesEnabled.call_args_list == [  # type: ignore[attr-defined]
+            call(False),
+            call(True),
+        ]
+
+    def test_blocks_scrollbar_signals_during_write(
+        self, mock_gui: MobiMarkerGUI
+    ) -> None:
+        """Scrollbar signals are blocked only while rows are written."""
+        scrollbar = QObject()
+        mock_gui.status_display.verticalScrollBar.return_value = scrollbar  # type: ignore[attr-defined]
+        blocked: list[bool] = []
+        mock_gui._status_model.rowsInserted.connect(
+            lambda *_: blocked.append(scrollbar.signalsBlocked())
+        )
+        mock_gui.update_status("Test")
 
-    def test_handles_none_scrollbar(self, mock_gui: MobiMarkerGUI) -> None:
-        """Handles None scrollbar gracefully."""
-        _status_display(mock_gui).verticalScrollBar.return_value = None
+        mock_gui._flush_status()
 
-        mock_gui.update_status("Test")  # Should not raise
+        assert blocked == [True]
+        assert not scrollbar.signalsBlocked()
 
 
 class TestCloseEvent:
     """Tests for MobiMarkerGUI.closeEvent() method."""
 
-    def test_quits_thread(self, mock_gui: MobiMarkerGUI) -> None:
-        """Thread is quit on close."""
-        _lsl_thread(mock_gui).wait.return_value = True
-        mock_event = Mock()
+    def test_stops_thread(self, mock_gui: MobiMarkerGUI, mock_event: Mock) -> None:
+        """Thread is stopped on close."""
+        mock_gui.lsl_thread.wait.return_value = True  # type: ignore[union-attr]
 
         mock_gui.closeEvent(mock_event)
 
-        _lsl_thread(mock_gui).quit.assert_called_once()
+        mock_gui.lsl_thread.stop.assert_called_once()  # type: ignore[union-attr]
 
-    def test_waits_for_thread(self, mock_gui: MobiMarkerGUI) -> None:
+    def test_waits_for_thread(self, mock_gui: MobiMarkerGUI, mock_event: Mock) -> None:
         """Waits for thread with timeout."""
-        _lsl_thread(mock_gui).wait.return_value = True
-        mock_event = Mock()
+        mock_gui.lsl_thread.wait.return_value = True  # type: ignore[union-attr]
 
         mock_gui.closeEvent(mock_event)
 
-        _lsl_thread(mock_gui).wait.assert_called_once_with(3000)
+        mock_gui.lsl_thread.wait.assert_called_once_with(3000)  # type: ignore[union-attr]
 
-    def test_accepts_event(self, mock_gui: MobiMarkerGUI) -> None:
+    def test_accepts_event(self, mock_gui: MobiMarkerGUI, mock_event: Mock) -> None:
         """Event is accepted."""
-        _lsl_thread(mock_gui).wait.return_value = True
-        mock_event = Mock()
+        mock_gui.lsl_thread.wait.return_value = True  # type: ignore[union-attr]
 
         mock_gui.closeEvent(mock_event)
 
         mock_event.accept.assert_called_once()
 
-    def test_timeout_terminates_thread(self, mock_gui: MobiMarkerGUI) -> None:
+    def test_timeout_terminates_thread(
+        self, mock_gui: MobiMarkerGUI, mock_event: Mock
+    ) -> None:
         """Thread is terminated on timeout."""
-        _lsl_thread(mock_gui).wait.side_effect = [False, True]
-        mock_event = Mock()
+        mock_gui.lsl_thread.wait.side_effect = iter(_WAIT_SEQ)  # type: ignore[union-attr]
 
-        with patch("mobi_marker.gui.format_status_message", return_value="warning"):
-            mock_gui.closeEvent(mock_event)
+        mock_gui.closeEvent(mock_event)
 
-        _lsl_thread(mock_gui).terminate.assert_called_once()
+        mock_gui.lsl_thread.terminate.assert_called_once()  # type: ignore[union-attr]
 
-    def test_no_thread_still_accepts(self, mock_gui: MobiMarkerGUI) -> None:
+    def test_no_thread_still_accepts(
+        self, mock_gui: MobiMarkerGUI, mock_event: Mock
+    ) -> None:
         """Event is accepted even with no thread."""
         mock_gui.lsl_thread = None
-        mock_event = Mock()
 
         mock_gui.closeEvent(mock_event)
 
@@ -341,7 +552,7 @@ class TestCloseEvent:
 
     def test_none_event_handled(self, mock_gui: MobiMarkerGUI) -> None:
         """None event is handled gracefully."""
-        _lsl_thread(mock_gui).wait.return_value = True
+        mock_gui.lsl_thread.wait.return_value = True  # type: ignore[union-attr]
 
         mock_gui.closeEvent(None)  # Should not raise
 
@@ -349,60 +560,40 @@ class TestCloseEvent:
 class TestStartLslStream:
     """Tests for MobiMarkerGUI.start_lsl_stream() method."""
 
-    def test_creates_and_starts_thread(self) -> None:
+    def test_creates_and_starts_thread(
+        self, freshly_inited_gui: SimpleNamespace
+    ) -> None:
         """Creates and starts LSLStreamThread instance."""
-        with (
-            patch("mobi_marker.gui.QApplication"),
-            patch("mobi_marker.gui.QMainWindow.__init__"),
-            patch("mobi_marker.gui.MobiMarkerGUI.init_ui"),
-        ):
-            with patch("mobi_marker.gui.LSLStreamThread") as mock_thread_class:
-                mock_thread = Mock()
-                mock_thread_class.return_value = mock_thread
-
-                _ = MobiMarkerGUI()
-
-        mock_thread_class.assert_called_once()
-        mock_thread.start.assert_called_once()
+        freshly_inited_gui.thread_class.assert_called_once()
+        freshly_inited_gui.gui.lsl_thread.start.assert_called_once()
 
 
 class TestMain:
     """Tests for main() function."""
 
-    def test_creates_application(self) -> None:
-        """Creates QApplication."""
+    def test_main_boots_app(self) -> None:
+        """Creates the named QApplication and shows the main window."""
         mock_app = Mock()
         mock_app.exec.return_value = 0
+        mock_window = Mock()
         with (
-            patch("mobi_marker.gui.QApplication", return_value=mock_app),
-            patch("mobi_marker.gui.MobiMarkerGUI"),
-            patch("mobi_marker.gui.sys.exit"),
+            patch.multiple(
+                gui_mod,
+                QApplication=Mock(return_value=mock_app),
+                MobiMarkerGUI=Mock(return_value=mock_window),
+            ),
+            patch.object(gui_mod.sys, "exit"),
         ):
             main()
 
         mock_app.setApplicationName.assert_called_once_with("MoBI Marker")
-
-    def test_shows_window(self) -> None:
-        """Shows the main window."""
-        mock_app = Mock()
-        mock_app.exec.return_value = 0
-        with (
-            patch("mobi_marker.gui.QApplication", return_value=mock_app),
-            patch("mobi_marker.gui.MobiMarkerGUI") as mock_gui_class,
-            patch("mobi_marker.gui.sys.exit"),
-        ):
-            mock_window = Mock()
-            mock_gui_class.return_value = mock_window
-
-            main()
-
         mock_window.show.assert_called_once()
 
     def test_exception_exits_with_error(self) -> None:
         """Exception causes exit with code 1."""
         with (
-            patch("mobi_marker.gui.QApplication", side_effect=Exception("fail")),
-            patch("mobi_marker.gui.sys.exit") as mock_exit,
+            patch.object(gui_mod, "QApplication", side_effect=Exception("fail")),
+            patch.object(gui_mod.sys, "exit") as mock_exit,
             patch("builtins.print"),
         ):
             main()
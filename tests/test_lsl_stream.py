@@ -1,289 +1,346 @@
 """Tests for the LSL stream module."""
 
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import Mock, patch
 
+import pytest
+
+import mobi_marker.lsl_stream as lsl_mod
 from mobi_marker.lsl_stream import (
     LSLStreamThread,
+    capture_status,
+    format_status_entry,
     format_status_message,
     format_timestamp,
 )
 
 
-class TestFormatTimestamp:
-    """Tests for format_timestamp function."""
+class FakeOutlet:
+    """Stand-in for StreamOutlet that records pushed samples."""
+
+    def __init__(self, info: object = None) -> None:
+        """Start with no samples pushed."""
+        self.samples: list[list[str]] = []
+
+    def push_sample(self, sample: list[str]) -> None:
+        """Record a pushed sample."""
+        self.samples.append(sample)
+
+
+class SlowOutlet(FakeOutlet):
+    """FakeOutlet whose pushes take long enough for markers to back up."""
+
+    def push_sample(self, sample: list[str]) -> None:
+        """Record a pushed sample after a short delay."""
+        time.sleep(0.01)
+        super().push_sample(sample)
+
+
+class FailingOutlet:
+    """Stand-in for StreamOutlet whose pushes always fail."""
+
+    def push_sample(self, sample: list[str]) -> None:
+        """Raise as a broken outlet would."""
+        raise Exception("push failed")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_lsl() -> Iterator[None]:
+    """Replace the pylsl objects once for every test in this module.
+
+    Tests that need a specific clock value or outlet override these with the
+    function-scoped `monkeypatch` fixture.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(lsl_mod, "StreamInfo", Mock())
+        mp.setattr(lsl_mod, "StreamOutlet", FakeOutlet)
+        mp.setattr(lsl_mod, "local_clock", lambda: 0.0)
+        yield
+
+
+# Raised from StreamInfo by the stream start failure tests
+_FAIL = Exception("test error")
+
+
+def _fail_patch() -> AbstractContextManager[Any]:
+    """Patch StreamInfo so that starting the stream raises `_FAIL`."""
+    return patch.object(lsl_mod, "StreamInfo", side_effect=_FAIL)
+
+
+def _collect(thread: LSLStreamThread, signal: str) -> list[Any]:
+    """Replace one of the thread's signals with a stub that records emits.
+
+    Logic tests only need the emitted values, so this skips Qt's signal
+    dispatch. Returns the list the emitted values are appended to.
+    """
+    emitted: list[Any] = []
+    setattr(thread, signal, SimpleNamespace(emit=emitted.append))
+    return emitted
+
+
+@pytest.fixture
+def thread_with_outlet() -> SimpleNamespace:
+    """Thread holding a FakeOutlet, with its status updates collected."""
+    outlet = FakeOutlet()
+    thread = LSLStreamThread()
+    thread.outlet = outlet
+    return SimpleNamespace(
+        thread=thread,
+        outlet=outlet,
+        status_messages=_collect(thread, "status_update"),
+    )
+
+
+def test_format_timestamp(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Returns the formatted wall-clock time and the LSL clock."""
+    monkeypatch.setattr(lsl_mod, "local_clock", lambda: 123.456)
+
+    human_time, lsl_time = format_timestamp()
+
+    # YYYY-MM-DD HH:MM:SS.mmm
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}", human_time)
+    assert lsl_time == 123.456
+
+
+def test_format_status_message_includes_message_and_timestamp(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Formatted message includes the input message and LSL timestamp."""
+    monkeypatch.setattr(lsl_mod, "local_clock", lambda: 100.0)
+
+    result = format_status_message("Test message")
+
+    assert "Test message" in result
+    assert "100.000" in result
+
+
+def test_format_status_message_keeps_percent_signs() -> None:
+    """Percent signs in the message are not treated as format specifiers."""
+    result = format_status_message("100% done")
+
+    assert result.endswith("| LSL: 0.000] 100% done")
+
+
+def test_capture_status_keeps_message_and_lsl_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Captured entry holds the LSL time and the unformatted message."""
+    monkeypatch.setattr(lsl_mod, "local_clock", lambda: 42.0)
+
+    _, lsl_time, message = capture_status("Test")
+
+    assert lsl_time == 42.0
+    assert message == "Test"
+
+
+def test_format_status_entry_matches_format_status_message() -> None:
+    """Formatting a captured entry gives the same layout as eager formatting."""
+    result = format_status_entry((0, 100.0, "Test"))
+
+    assert result.endswith("| LSL: 100.000] Test")
+    assert re.match(r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.000 \|", result)
+
+
+def test_format_status_entry_matches_strftime_at_whole_milliseconds() -> None:
+    """Milliseconds are not truncated low when the time is a whole millisecond."""
+    for ms in range(1000):
+        now_ns = 1_700_000_000_000_000_000 + ms * 1_000_000
+        expected = datetime.fromtimestamp(now_ns / 1e9).strftime(
+            "%Y-%m-%d %H:%M:%S.%f"
+        )[:-3]
+
+        result = format_status_entry((now_ns, 0.0, "Test"))
+
+        assert result.startswith(f"[{expected} |")
+
+
+def test_thread_initial_state() -> None:
+    """No outlet or stream info, and not ready, before run() is called."""
+    thread = LSLStreamThread()
+
+    assert thread.outlet is None
+    assert thread.stream_info is None
+    assert thread._is_ready is False
+
+
+def test_run_success(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Successful run sets the outlet and ready flag and reports success."""
+    outlet = FakeOutlet()
+    monkeypatch.setattr(lsl_mod, "StreamOutlet", lambda info: outlet)
+    thread = LSLStreamThread()
+    thread.stop()
+    ready_signals: list[bool] = _collect(thread, "stream_ready")
+    status_messages: list[str] = _collect(thread, "status_update")
+
+    thread.run()
+
+    assert thread.outlet is outlet
+    assert thread._is_ready is True
+    assert ready_signals == [True]
+    assert len(status_messages) == 1
+    assert "started successfully" in status_messages[0]
+
+
+def test_stop_pushes_markers_still_queued(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Markers queued before stop() are all pushed before the thread exits."""
+    outlet = SlowOutlet()
+    monkeypatch.setattr(lsl_mod, "StreamOutlet", lambda info: outlet)
+    thread = LSLStreamThread()
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not thread._is_ready and time.monotonic() < deadline:
+        time.sleep(0.001)
+    markers = [f"MARKER_{i}" for i in range(20)]
+
+    for marker in markers:
+        thread.send_marker(marker)
+    thread.stop()
+
+    assert thread.wait(5000)
+    assert outlet.samples == [[m] for m in markers]
+
+
+def test_run_pushes_no_samples_of_its_own(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Starting the stream sends nothing, so recordings hold only user markers."""
+    outlet = FakeOutlet()
+    monkeypatch.setattr(lsl_mod, "StreamOutlet", lambda info: outlet)
+    thread = LSLStreamThread()
+    thread.stop()
+
+    thread.run()
+
+    assert outlet.samples == []
+
+
+def test_run_stop_during_outlet_creation_returns(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A stop request while the outlet is being created ends run() early."""
+    release = threading.Event()
+    monkeypatch.setattr(lsl_mod, "StreamOutlet", lambda info: release.wait(5))
+    thread = LSLStreamThread()
+    ready_signals: list[bool] = _collect(thread, "stream_ready")
+
+    with patch.object(thread, "isInterruptionRequested", return_value=True):
+        thread.run()
+    release.set()
+
+    assert ready_signals == []
+    assert thread._is_ready is False
+
+
+def test_run_creates_outlet_on_daemon_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The outlet is created on a daemon thread, so a hang cannot block exit."""
+    daemon_flags: list[bool] = []
+
+    def create_outlet(info: object) -> FakeOutlet:
+        daemon_flags.append(threading.current_thread().daemon)
+        return FakeOutlet()
+
+    monkeypatch.setattr(lsl_mod, "StreamOutlet", create_outlet)
+    thread = LSLStreamThread()
+    thread.stop()
+
+    thread.run()
+
+    assert daemon_flags == [True]
+
+
+def test_run_failure_emits_stream_ready_false() -> None:
+    """Failed run emits stream_ready with False."""
+    with _fail_patch():
+        thread = LSLStreamThread()
+        ready_signals: list[bool] = _collect(thread, "stream_ready")
+
+        thread.run()
+
+    assert ready_signals == [False]
+
+
+def test_run_failure_emits_error_status() -> None:
+    """Failed run emits status update with error message."""
+    with _fail_patch():
+        thread = LSLStreamThread()
+        status_messages: list[str] = _collect(thread, "status_update")
+
+        thread.run()
+
+    assert len(status_messages) == 1
+    assert "Error" in status_messages[0]
+    assert str(_FAIL) in status_messages[0]
+
+
+def test_send_marker_when_not_ready_emits_error() -> None:
+    """Sending marker when not ready emits error status."""
+    thread = LSLStreamThread()
+    status_messages: list[str] = _collect(thread, "status_update")
+
+    thread.send_marker("TEST")
+
+    assert len(status_messages) == 1
+    assert "not active" in status_messages[0]
+
+
+def test_send_marker_when_ready_queues_marker() -> None:
+    """Sending marker when ready puts it on the worker queue."""
+    thread = LSLStreamThread()
+    thread._is_ready = True
+
+    thread.send_marker("TEST_MARKER")
+
+    assert thread._queue.get_nowait() == "TEST_MARKER"
+
+
+def test_stop_queues_sentinel() -> None:
+    """Stopping puts the None sentinel on the worker queue."""
+    thread = LSLStreamThread()
+
+    thread.stop()
 
-    def test_returns_human_time_and_lsl_time(self) -> None:
-        """Returns tuple of human-readable time and LSL clock."""
-        with patch("mobi_marker.lsl_stream.local_clock", return_value=123.456):
-            human_time, lsl_time = format_timestamp()
+    assert thread._queue.get_nowait() is None
 
-        assert isinstance(human_time, str)
-        assert lsl_time == 123.456
 
-    def test_human_time_format(self) -> None:
-        """Human time follows expected format."""
-        with patch("mobi_marker.lsl_stream.local_clock", return_value=0):
-            human_time, _ = format_timestamp()
+@pytest.mark.parametrize("marker", ["TEST_MARKER", "MY_MARKER", "END EEG"])
+def test_handle_request_success(
+    marker: str, thread_with_outlet: SimpleNamespace
+) -> None:
+    """Handler pushes the marker on the outlet and reports it as sent."""
+    thread_with_outlet.thread._handle_marker_request(marker)
 
-        # Should contain date and time components
-        assert "-" in human_time  # date separator
-        assert ":" in human_time  # time separator
+    assert thread_with_outlet.outlet.samples == [[marker]]
+    (status,) = thread_with_outlet.status_messages
+    assert status.endswith(f"] Sent marker: {marker}")
 
 
-class TestFormatStatusMessage:
-    """Tests for format_status_message function."""
+def test_handle_request_with_none_outlet_emits_error() -> None:
+    """Handler with None outlet emits error status."""
+    thread = LSLStreamThread()
+    thread.outlet = None
+    status_messages: list[str] = _collect(thread, "status_update")
 
-    def test_includes_message(self) -> None:
-        """Formatted message includes the input message."""
-        with patch("mobi_marker.lsl_stream.local_clock", return_value=100.0):
-            result = format_status_message("Test message")
+    thread._handle_marker_request("MARKER")
 
-        assert "Test message" in result
-
-    def test_includes_timestamps(self) -> None:
-        """Formatted message includes LSL timestamp."""
-        with patch("mobi_marker.lsl_stream.local_clock", return_value=100.0):
-            result = format_status_message("Test")
+    assert len(status_messages) == 1
+    assert "not active" in status_messages[0]
 
-        assert "100.000" in result
 
+def test_handle_request_push_failure_emits_error() -> None:
+    """Handler emits error when push_sample fails."""
+    thread = LSLStreamThread()
+    thread.outlet = FailingOutlet()
+    status_messages: list[str] = _collect(thread, "status_update")
 
-class TestLSLStreamThreadInit:
-    """Tests for LSLStreamThread initialization."""
-
-    def test_initializes_with_none_outlet(self) -> None:
-        """Outlet is None before stream starts."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-        ):
-            thread = LSLStreamThread()
-
-        assert thread.outlet is None
+    thread._handle_marker_request("MARKER")
 
-    def test_initializes_with_none_stream_info(self) -> None:
-        """Stream info is None before stream starts."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-        ):
-            thread = LSLStreamThread()
-
-        assert thread.stream_info is None
-
-    def test_initializes_not_ready(self) -> None:
-        """Thread is not ready before run() is called."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-        ):
-            thread = LSLStreamThread()
-
-        assert thread._is_ready is False
-
-
-class TestLSLStreamThreadRun:
-    """Tests for LSLStreamThread.run() method."""
-
-    def test_run_success_sets_outlet(self) -> None:
-        """Successful run sets the outlet."""
-        mock_outlet = Mock()
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet", return_value=mock_outlet),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-            patch.object(LSLStreamThread, "exec"),
-        ):
-            thread = LSLStreamThread()
-
-            thread.run()
-
-        assert thread.outlet == mock_outlet
-
-    def test_run_success_sets_ready(self) -> None:
-        """Successful run sets _is_ready to True."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-            patch.object(LSLStreamThread, "exec"),
-        ):
-            thread = LSLStreamThread()
-
-            thread.run()
-
-        assert thread._is_ready is True
-
-    def test_run_success_emits_stream_ready_true(self) -> None:
-        """Successful run emits stream_ready with True."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-            patch.object(LSLStreamThread, "exec"),
-        ):
-            thread = LSLStreamThread()
-            ready_signals: list[bool] = []
-            thread.stream_ready.connect(ready_signals.append)
-
-            thread.run()
-
-        assert ready_signals == [True]
-
-    def test_run_success_emits_status_update(self) -> None:
-        """Successful run emits status update with success message."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-            patch.object(LSLStreamThread, "exec"),
-        ):
-            thread = LSLStreamThread()
-            status_messages: list[str] = []
-            thread.status_update.connect(status_messages.append)
-
-            thread.run()
-
-        assert len(status_messages) == 1
-        assert "started successfully" in status_messages[0]
-
-    def test_run_failure_emits_stream_ready_false(self) -> None:
-        """Failed run emits stream_ready with False."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo", side_effect=Exception("fail")),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-        ):
-            thread = LSLStreamThread()
-            ready_signals: list[bool] = []
-            thread.stream_ready.connect(ready_signals.append)
-
-            thread.run()
-
-        assert ready_signals == [False]
-
-    def test_run_failure_emits_error_status(self) -> None:
-        """Failed run emits status update with error message."""
-        with (
-            patch(
-                "mobi_marker.lsl_stream.StreamInfo", side_effect=Exception("test error")
-            ),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-        ):
-            thread = LSLStreamThread()
-            status_messages: list[str] = []
-            thread.status_update.connect(status_messages.append)
-
-            thread.run()
-
-        assert len(status_messages) == 1
-        assert "Error" in status_messages[0]
-        assert "test error" in status_messages[0]
-
-
-class TestLSLStreamThreadSendMarker:
-    """Tests for LSLStreamThread.send_marker() method."""
-
-    def test_send_marker_when_not_ready_emits_error(self) -> None:
-        """Sending marker when not ready emits error status."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-        ):
-            thread = LSLStreamThread()
-            status_messages: list[str] = []
-            thread.status_update.connect(status_messages.append)
-
-            thread.send_marker("TEST")
-
-        assert len(status_messages) == 1
-        assert "not active" in status_messages[0]
-
-    def test_send_marker_when_ready_emits_request(self) -> None:
-        """Sending marker when ready emits marker_request signal."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-        ):
-            thread = LSLStreamThread()
-            thread._is_ready = True
-            marker_requests: list[str] = []
-            thread.marker_request.connect(marker_requests.append)
-
-            thread.send_marker("TEST_MARKER")
-
-        assert marker_requests == ["TEST_MARKER"]
-
-
-class TestLSLStreamThreadHandleMarkerRequest:
-    """Tests for LSLStreamThread._handle_marker_request() method."""
-
-    def test_handle_request_with_outlet_pushes_sample(self) -> None:
-        """Handler with valid outlet calls push_sample."""
-        mock_outlet = Mock()
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-        ):
-            thread = LSLStreamThread()
-            thread.outlet = mock_outlet
-
-            thread._handle_marker_request("MARKER")
-
-        mock_outlet.push_sample.assert_called_once_with(["MARKER"])
-
-    def test_handle_request_success_emits_status(self) -> None:
-        """Successful marker send emits status update."""
-        mock_outlet = Mock()
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-        ):
-            thread = LSLStreamThread()
-            thread.outlet = mock_outlet
-            status_messages: list[str] = []
-            thread.status_update.connect(status_messages.append)
-
-            thread._handle_marker_request("MY_MARKER")
-
-        assert len(status_messages) == 1
-        assert "Sent marker: MY_MARKER" in status_messages[0]
-
-    def test_handle_request_with_none_outlet_emits_error(self) -> None:
-        """Handler with None outlet emits error status."""
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-        ):
-            thread = LSLStreamThread()
-            thread.outlet = None
-            status_messages: list[str] = []
-            thread.status_update.connect(status_messages.append)
-
-            thread._handle_marker_request("MARKER")
-
-        assert len(status_messages) == 1
-        assert "not active" in status_messages[0]
-
-    def test_handle_request_push_failure_emits_error(self) -> None:
-        """Handler emits error when push_sample fails."""
-        mock_outlet = Mock()
-        mock_outlet.push_sample.side_effect = Exception("push failed")
-        with (
-            patch("mobi_marker.lsl_stream.StreamInfo"),
-            patch("mobi_marker.lsl_stream.StreamOutlet"),
-            patch("mobi_marker.lsl_stream.local_clock", return_value=0),
-        ):
-            thread = LSLStreamThread()
-            thread.outlet = mock_outlet
-            status_messages: list[str] = []
-            thread.status_update.connect(status_messages.append)
-
-            thread._handle_marker_request("MARKER")
-
-        assert len(status_messages) == 1
-        assert "Error sending marker" in status_messages[0]
-        assert "push failed" in status_messages[0]
+    assert len(status_messages) == 1
+    assert "Error sending marker" in status_messages[0]
+    assert "push failed" in status_messages[0]
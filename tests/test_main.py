@@ -1,8 +1,11 @@
 """Tests for the main entry point."""
 
+import importlib
+
 
 def test_import() -> None:
-    """Main function is importable and callable."""
-    from mobi_marker import main
+    """Every public name of the package is importable and callable."""
+    package = importlib.import_module("mobi_marker")
 
-    assert callable(main)
+    for name in package.__all__:
+        assert callable(getattr(package, name))